@@ -5,8 +5,10 @@ Manages application configuration and user preferences using JSON files.
 """
 
 import json
+import os
+import threading
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 from datetime import datetime
 
 
@@ -64,6 +66,11 @@ class ConfigManager:
         self.config_file = config_file
         self.config: Dict[str, Any] = {}
 
+        # Serialises file writes; snapshots may be written from worker threads
+        self._save_lock = threading.Lock()
+        self._snapshot_seq = 0  # Last snapshot taken
+        self._written_seq = 0  # Last snapshot written to disk
+
         self.load()
 
     def load(self):
@@ -83,16 +90,69 @@ class ConfigManager:
             self.config = self.DEFAULT_CONFIG.copy()
             self.save()
 
-    def save(self):
-        """Save configuration to file."""
-        try:
-            self.config_file.parent.mkdir(parents=True, exist_ok=True)
-
-            with open(self.config_file, 'w') as f:
-                json.dump(self.config, f, indent=2)
+    def save(self) -> bool:
+        """
+        Save configuration to file.
 
+        Returns:
+            bool: True if the file was written
+        """
+        try:
+            snapshot = self.snapshot()
         except Exception as e:
             print(f"Error saving config: {e}")
+            return False
+
+        return self.write_snapshot(*snapshot)
+
+    def snapshot(self) -> Tuple[int, str]:
+        """
+        Serialize the current configuration for ``write_snapshot``.
+
+        Call this on the thread that modifies the configuration (the GUI
+        thread); the returned text can then be written from any thread.
+
+        Returns:
+            tuple: (sequence number, JSON text)
+        """
+        text = json.dumps(self.config, indent=2)
+        with self._save_lock:
+            self._snapshot_seq += 1
+            return self._snapshot_seq, text
+
+    def write_snapshot(self, seq: int, text: str) -> bool:
+        """
+        Write a snapshot from ``snapshot`` to the config file.
+
+        Safe to call from any thread. The file is replaced atomically, and
+        a snapshot older than one already written is skipped so a slow
+        background write can't overwrite newer settings.
+
+        Args:
+            seq: Sequence number returned by snapshot()
+            text: JSON text returned by snapshot()
+
+        Returns:
+            bool: True if the file is up to date with this snapshot
+        """
+        with self._save_lock:
+            if seq < self._written_seq:
+                return True
+
+            tmp_file = self.config_file.with_name(self.config_file.name + '.tmp')
+            try:
+                self.config_file.parent.mkdir(parents=True, exist_ok=True)
+
+                with open(tmp_file, 'w') as f:
+                    f.write(text)
+                os.replace(tmp_file, self.config_file)
+
+            except Exception as e:
+                print(f"Error saving config: {e}")
+                return False
+
+            self._written_seq = seq
+            return True
 
     def _merge_defaults(self):
         """Merge loaded config with defaults for missing keys."""
@@ -153,6 +213,49 @@ class ConfigManager:
         if auto_save:
             self.save()
 
+    def get_many(self, spec: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Get several configuration values at once.
+
+        Keys sharing a parent section only walk to that section once.
+
+        Args:
+            spec: Mapping of key path -> default value
+
+        Returns:
+            dict: Mapping of key path -> configuration value
+        """
+        parents: Dict[str, Any] = {}
+        values = {}
+
+        for key_path, default in spec.items():
+            parent_path, _, key = key_path.rpartition('.')
+
+            if parent_path not in parents:
+                parents[parent_path] = self.get(parent_path) if parent_path else self.config
+            parent = parents[parent_path]
+
+            if isinstance(parent, dict) and key in parent:
+                values[key_path] = parent[key]
+            else:
+                values[key_path] = default
+
+        return values
+
+    def set_many(self, values: Dict[str, Any], auto_save: bool = True):
+        """
+        Set several configuration values with a single save.
+
+        Args:
+            values: Mapping of key path -> value
+            auto_save: Automatically save after setting
+        """
+        for key_path, value in values.items():
+            self.set(key_path, value, auto_save=False)
+
+        if auto_save:
+            self.save()
+
     # Convenience methods for common settings
 
     def get_serial_config(self) -> Dict[str, Any]:
@@ -215,7 +318,8 @@ class ConfigManager:
 
         return self.config['presets'].get(experiment_name, {})
 
-    def save_preset(self, experiment_name: str, preset_name: str, parameters: Dict[str, Any]):
+    def save_preset(self, experiment_name: str, preset_name: str, parameters: Dict[str, Any],
+                    auto_save: bool = True):
         """
         Save a parameter preset for an experiment.
 
@@ -223,6 +327,7 @@ class ConfigManager:
             experiment_name: Name of experiment (CV, LSV, etc.)
             preset_name: Name for this preset
             parameters: Parameter values to save
+            auto_save: Automatically save after setting
         """
         if 'presets' not in self.config:
             self.config['presets'] = {}
@@ -231,7 +336,8 @@ class ConfigManager:
             self.config['presets'][experiment_name] = {}
 
         self.config['presets'][experiment_name][preset_name] = parameters.copy()
-        self.save()
+        if auto_save:
+            self.save()
 
     def load_preset(self, experiment_name: str, preset_name: str) -> Optional[Dict[str, Any]]:
         """
@@ -247,19 +353,21 @@ class ConfigManager:
         presets = self.get_presets(experiment_name)
         return presets.get(preset_name)
 
-    def delete_preset(self, experiment_name: str, preset_name: str):
+    def delete_preset(self, experiment_name: str, preset_name: str, auto_save: bool = True):
         """
         Delete a parameter preset.
 
         Args:
             experiment_name: Name of experiment
             preset_name: Name of preset to delete
+            auto_save: Automatically save after deleting
         """
         if 'presets' in self.config:
             if experiment_name in self.config['presets']:
                 if preset_name in self.config['presets'][experiment_name]:
                     del self.config['presets'][experiment_name][preset_name]
-                    self.save()
+                    if auto_save:
+                        self.save()
 
     def rename_preset(self, experiment_name: str, old_name: str, new_name: str):
         """
@@ -11,10 +11,15 @@ from PyQt5.QtWidgets import (
     QGroupBox, QLabel, QMessageBox, QFileDialog, QRadioButton,
     QButtonGroup
 )
-from PyQt5.QtCore import pyqtSignal, QTimer, Qt
+from PyQt5.QtCore import (
+    pyqtSignal, QTimer, Qt, QObject, QRunnable, QThreadPool, QFileSystemWatcher
+)
 from pathlib import Path
+import sys
 from datetime import datetime
+import numpy as np
 import pyqtgraph as pg
+import serial.tools.list_ports as list_ports
 
 from ..experiments import get_registry, BaseExperiment, ExperimentState
 from ..communication.serial_manager import SerialManager
@@ -25,6 +30,31 @@ from .parameter_panel import ParameterPanel
 from .analysis_panel import AnalysisPanel
 
 
+# Sentinel for single-lookup key checks on incoming data points
+_MISSING = object()
+
+
+class _PortScanSignals(QObject):
+    """Signals emitted by the background serial port scan."""
+
+    finished = pyqtSignal(list)  # Available port device names
+
+
+class _PortScanTask(QRunnable):
+    """Enumerate serial ports off the GUI thread."""
+
+    def __init__(self, signals: _PortScanSignals):
+        super().__init__()
+        self.signals = signals
+
+    def run(self):
+        ports = []
+        try:
+            ports = [port.device for port in list_ports.comports()]
+        finally:
+            self.signals.finished.emit(ports)
+
+
 class MainWindow(QMainWindow):
     """
     Main application window for SaxStat GUI.
@@ -38,6 +68,13 @@ class MainWindow(QMainWindow):
     experiment_stopped = pyqtSignal()
     experiment_completed = pyqtSignal()
 
+    # Save dialog filter prefix -> DataManager export method
+    _EXPORTERS = {
+        "CSV": "export_csv",
+        "Excel": "export_excel",
+        "JSON": "export_json",
+    }
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("SaxStat v1.2 - Portable Potentiostat")
@@ -49,6 +86,23 @@ class MainWindow(QMainWindow):
         self.data_manager = DataManager()
         self.plot_manager = None  # Created after plot widget
         self.current_experiment: BaseExperiment = None
+        self._experiment_running = False  # Tracked via state_changed signal
+        self._close_prompt: QMessageBox = None  # Non-modal exit confirmation
+        self._close_confirmed = False
+        self._x_key = 'time'  # Data keys for main plot, cached per experiment
+        self._y_key = 'current'
+
+        # Serial port enumeration runs on the thread pool; results are cached
+        self._ports_cache: list = []
+        self._port_scan_pending = False
+        self._port_scan_signals = _PortScanSignals(self)
+        self._port_scan_signals.finished.connect(self._on_ports_scanned)
+
+        # Re-scan when device nodes appear or disappear (Linux)
+        self._dev_watcher = None
+        if sys.platform.startswith('linux') and Path('/dev').is_dir():
+            self._dev_watcher = QFileSystemWatcher(['/dev'], self)
+            self._dev_watcher.directoryChanged.connect(self._refresh_ports)
         self.experiment_registry = get_registry()
 
         # Apply modern styling
@@ -266,28 +320,27 @@ class MainWindow(QMainWindow):
 
         # Applied voltage vs time plot (left)
         self.voltage_time_widget = pg.PlotWidget()
-        self.voltage_time_widget.setBackground('w')
-        self.voltage_time_widget.showGrid(x=True, y=True)
-        # Axis styling will be set by PlotManager after initialization
+        # Background, grid and axis styling are applied by PlotManager
         right_layout.addWidget(self.voltage_time_widget)
 
         # Main data plot (right - current vs voltage or time)
         self.plot_widget = pg.PlotWidget()
-        self.plot_widget.setBackground('w')
-        self.plot_widget.showGrid(x=True, y=True)
-        # Axis styling will be set by PlotManager after initialization
+        # Background, grid and axis styling are applied by PlotManager
         right_layout.addWidget(self.plot_widget)
 
         # Create plot managers
         self.plot_manager = PlotManager(self.plot_widget)
-        self.voltage_plot_manager = PlotManager(self.voltage_time_widget)
-
-        # Set labels for voltage plot after PlotManager initialization (override defaults)
-        self.voltage_plot_manager.set_labels('Time (s)', 'Voltage (V)', 'Applied Voltage vs Time')
+        self.voltage_plot_manager = PlotManager(
+            self.voltage_time_widget,
+            'Time (s)', 'Voltage (V)', 'Applied Voltage vs Time',
+            monotonic_x=True
+        )
+        self.plot_manager.export_finished.connect(self._on_plot_saved)
 
-        # Analysis visualization items
+        # Analysis visualization items (curves are created once and reused)
         self.peak_markers = []
         self.baseline_curve = None
+        self.smoothed_curve = None
 
         # Add panels to main layout
         splitter = QSplitter(Qt.Horizontal)
@@ -417,9 +470,21 @@ class MainWindow(QMainWindow):
                 self.experiment_combo.setCurrentIndex(index)
 
     def _refresh_ports(self):
-        """Refresh available serial ports."""
-        import serial.tools.list_ports
-        ports = [port.device for port in serial.tools.list_ports.comports()]
+        """Start a background refresh of available serial ports."""
+        if self._port_scan_pending:
+            return
+
+        self._port_scan_pending = True
+        QThreadPool.globalInstance().start(_PortScanTask(self._port_scan_signals))
+
+    def _on_ports_scanned(self, ports: list):
+        """Update port list with the result of a background scan."""
+        self._port_scan_pending = False
+
+        # Keep the current selection/edit if nothing changed
+        if ports == self._ports_cache and self.port_combo.count():
+            return
+        self._ports_cache = ports
 
         self.port_combo.clear()
         self.port_combo.addItems(ports)
@@ -458,11 +523,14 @@ class MainWindow(QMainWindow):
 
             # Update plot configuration
             plot_config = self.current_experiment.get_plot_config()
+            self._x_key = plot_config.get('x_data', 'time')
+            self._y_key = plot_config.get('y_data', 'current')
             self.plot_manager.set_labels(
                 plot_config.get('x_label', 'X'),
                 plot_config.get('y_label', 'Y'),
                 plot_config.get('title', exp_name)
             )
+            self.plot_manager.set_x_monotonic(self._x_key == 'time')
 
             # Save to config
             self.config.set('experiments.last_experiment', exp_name)
@@ -598,6 +666,12 @@ class MainWindow(QMainWindow):
 
     def _on_experiment_state_changed(self, state: ExperimentState):
         """Handle experiment state change."""
+        self._experiment_running = (state == ExperimentState.RUNNING)
+
+        # Fixed, incrementally tracked ranges while data is streaming in
+        self.plot_manager.set_streaming(self._experiment_running)
+        self.voltage_plot_manager.set_streaming(self._experiment_running)
+
         if state == ExperimentState.COMPLETED:
             self._reset_ui_after_experiment()
             self.save_btn.setEnabled(True)
@@ -620,23 +694,23 @@ class MainWindow(QMainWindow):
         self.data_manager.add_data_point(data_point)
 
         # Update applied voltage plot (always time vs voltage)
-        if 'time' in data_point and 'voltage' in data_point:
-            self.voltage_plot_manager.add_point(data_point['time'], data_point['voltage'])
+        t = data_point.get('time', _MISSING)
+        v = data_point.get('voltage', _MISSING)
+        if t is not _MISSING and v is not _MISSING:
+            self.voltage_plot_manager.add_point(t, v)
 
         # Update main plot
-        plot_config = self.current_experiment.get_plot_config()
-        x_key = plot_config.get('x_data', 'time')
-        y_key = plot_config.get('y_data', 'current')
-
-        if x_key in data_point and y_key in data_point:
-            self.plot_manager.add_point(data_point[x_key], data_point[y_key])
+        plot_manager = self.plot_manager
+        x = data_point.get(self._x_key, _MISSING)
+        y = data_point.get(self._y_key, _MISSING)
+        if x is not _MISSING and y is not _MISSING:
+            plot_manager.add_point(x, y)
 
         # Update analysis panel with latest data
-        if len(self.plot_manager.x_data) > 10:  # Wait for sufficient data
-            import numpy as np
+        if len(plot_manager.x_data) > 10:  # Wait for sufficient data
             self.analysis_panel.set_data(
-                np.array(self.plot_manager.x_data),
-                np.array(self.plot_manager.y_data)
+                np.array(plot_manager.x_data),
+                np.array(plot_manager.y_data)
             )
 
     def _on_experiment_error(self, error: str):
@@ -669,13 +743,11 @@ class MainWindow(QMainWindow):
             try:
                 file_path = Path(file_path)
 
-                # Save based on file extension
-                if file_filter.startswith("CSV"):
-                    self.data_manager.export_csv(file_path)
-                elif file_filter.startswith("Excel"):
-                    self.data_manager.export_excel(file_path)
-                elif file_filter.startswith("JSON"):
-                    self.data_manager.export_json(file_path)
+                # Save based on selected file filter
+                prefix = file_filter.split(' ', 1)[0]
+                exporter = self._EXPORTERS.get(prefix)
+                if exporter is not None:
+                    getattr(self.data_manager, exporter)(file_path)
 
                 self.statusbar.showMessage(f"Data saved to {file_path}")
 
@@ -780,12 +852,20 @@ class MainWindow(QMainWindow):
 
         if file_path:
             try:
+                # Shown first: export_finished may be emitted before export_image returns
+                self.statusbar.showMessage(f"Saving plot to {file_path}...")
                 self.plot_manager.export_image(Path(file_path))
-                self.statusbar.showMessage(f"Plot saved to {file_path}")
 
             except Exception as e:
                 QMessageBox.critical(self, "Save Error", f"Failed to save plot:\n{str(e)}")
 
+    def _on_plot_saved(self, file_path: str, ok: bool):
+        """Report the result of a background plot export."""
+        if ok:
+            self.statusbar.showMessage(f"Plot saved to {file_path}")
+        else:
+            QMessageBox.critical(self, "Save Error", f"Failed to save plot:\n{file_path}")
+
     def _on_analysis_tools_clicked(self):
         """Handle analysis tools menu action."""
         from PyQt5.QtWidgets import QDialog, QVBoxLayout
@@ -934,101 +1014,119 @@ class MainWindow(QMainWindow):
             self.plot_widget.removeItem(marker)
         self.peak_markers.clear()
 
-        # Clear baseline curve
-        if self.baseline_curve is not None:
-            self.plot_widget.removeItem(self.baseline_curve)
-            self.baseline_curve = None
+        # Empty the persistent baseline and smoothed curves
+        for curve in (self.baseline_curve, self.smoothed_curve):
+            if curve is not None:
+                curve.setData([], [])
 
     def _visualize_peaks(self, analysis_data: dict):
         """Visualize detected peaks on plot."""
-        import numpy as np
-
         results = analysis_data.get('results', {})
-        x_data = np.array(self.plot_manager.x_data)
+        x_data = self.plot_manager.x_array
         y_data = np.array(self.plot_manager.y_data)
 
         # Anodic peaks (red markers)
-        anodic_peaks = results.get('anodic_peaks', [])
-        for peak_idx in anodic_peaks:
-            if peak_idx < len(x_data):
-                scatter = pg.ScatterPlotItem(
-                    [x_data[peak_idx]],
-                    [y_data[peak_idx]],
-                    symbol='o',
-                    size=12,
-                    pen=pg.mkPen('r', width=2),
-                    brush=pg.mkBrush(255, 0, 0, 100)
-                )
-                self.plot_widget.addItem(scatter)
-                self.peak_markers.append(scatter)
+        self._add_peak_markers(
+            results.get('anodic_peaks', []), x_data, y_data,
+            pen=pg.mkPen('r', width=2),
+            brush=pg.mkBrush(255, 0, 0, 100)
+        )
 
         # Cathodic peaks (blue markers)
-        cathodic_peaks = results.get('cathodic_peaks', [])
-        for peak_idx in cathodic_peaks:
-            if peak_idx < len(x_data):
-                scatter = pg.ScatterPlotItem(
-                    [x_data[peak_idx]],
-                    [y_data[peak_idx]],
-                    symbol='o',
-                    size=12,
-                    pen=pg.mkPen('b', width=2),
-                    brush=pg.mkBrush(0, 0, 255, 100)
-                )
-                self.plot_widget.addItem(scatter)
-                self.peak_markers.append(scatter)
+        self._add_peak_markers(
+            results.get('cathodic_peaks', []), x_data, y_data,
+            pen=pg.mkPen('b', width=2),
+            brush=pg.mkBrush(0, 0, 255, 100)
+        )
+
+    def _add_peak_markers(self, peaks, x_data: np.ndarray, y_data: np.ndarray,
+                          pen, brush):
+        """
+        Add one scatter item marking all in-range peak indices.
+
+        Args:
+            peaks: Peak indices into x_data/y_data
+            x_data: X data array
+            y_data: Y data array
+            pen: Marker outline pen
+            brush: Marker fill brush
+        """
+        peaks = np.asarray(peaks, dtype=np.intp)
+        peaks = peaks[peaks < len(x_data)]
+        if not peaks.size:
+            return
+
+        scatter = pg.ScatterPlotItem(
+            x_data[peaks],
+            y_data[peaks],
+            symbol='o',
+            size=12,
+            pen=pen,
+            brush=brush
+        )
+        self.plot_widget.addItem(scatter)
+        self.peak_markers.append(scatter)
 
     def _visualize_baseline(self, analysis_data: dict):
         """Visualize baseline correction on plot."""
-        import numpy as np
-
         baseline = analysis_data.get('baseline')
-        x_data = np.array(self.plot_manager.x_data)
+        if baseline is None:
+            return
 
-        if baseline is not None and len(baseline) == len(x_data):
-            # Add baseline curve (orange dashed line)
-            self.baseline_curve = self.plot_widget.plot(
-                x_data,
-                baseline,
+        # No copy if the analysis already returned an ndarray
+        baseline = np.asarray(baseline)
+        x_data = self.plot_manager.x_array
+        if baseline.size != x_data.size:
+            return
+
+        if self.baseline_curve is None:
+            # Create baseline curve once (orange dashed line)
+            self.baseline_curve = pg.PlotCurveItem(
                 pen=pg.mkPen(color='orange', width=2, style=Qt.DashLine)
             )
+            self.plot_widget.addItem(self.baseline_curve)
+        self.baseline_curve.setData(x_data, baseline)
 
     def _visualize_smoothed(self, analysis_data: dict):
         """Visualize smoothed data on plot."""
-        import numpy as np
-
         smoothed_data = analysis_data.get('smoothed_data')
-        x_data = np.array(self.plot_manager.x_data)
+        if smoothed_data is None:
+            return
 
-        if smoothed_data is not None and len(smoothed_data) == len(x_data):
-            # Add smoothed curve (green line)
-            smoothed_curve = self.plot_widget.plot(
-                x_data,
-                smoothed_data,
+        # No copy if the analysis already returned an ndarray
+        smoothed_data = np.asarray(smoothed_data)
+        x_data = self.plot_manager.x_array
+        if smoothed_data.size != x_data.size:
+            return
+
+        if self.smoothed_curve is None:
+            # Create smoothed curve once (green line)
+            self.smoothed_curve = pg.PlotCurveItem(
                 pen=pg.mkPen(color='green', width=2)
             )
-            self.peak_markers.append(smoothed_curve)  # Store for clearing
+            self.plot_widget.addItem(self.smoothed_curve)
+        self.smoothed_curve.setData(x_data, smoothed_data)
 
     def closeEvent(self, event):
         """Handle window close event."""
-        # Check if experiment is running
-        if self.current_experiment and self.current_experiment.state == ExperimentState.RUNNING:
-            reply = QMessageBox.question(
-                self,
-                "Experiment Running",
-                "An experiment is currently running. Are you sure you want to exit?",
-                QMessageBox.Yes | QMessageBox.No,
-                QMessageBox.No
-            )
-
-            if reply == QMessageBox.No:
-                event.ignore()
-                return
+        # Check if experiment is running; confirm without blocking the
+        # event loop so incoming data keeps being processed meanwhile
+        if self._experiment_running and not self._close_confirmed:
+            event.ignore()
+
+            if self._close_prompt is None:
+                self._close_prompt = QMessageBox(
+                    QMessageBox.Question,
+                    "Experiment Running",
+                    "An experiment is currently running. Are you sure you want to exit?",
+                    QMessageBox.Yes | QMessageBox.No,
+                    self
+                )
+                self._close_prompt.setDefaultButton(QMessageBox.No)
+                self._close_prompt.finished.connect(self._on_close_prompt_finished)
 
-            # Stop experiment
-            try:
-                self.current_experiment.stop()
-            except:
-                pass
+            self._close_prompt.open()
+            return
 
         # Save window geometry
         self.config.set_window_geometry(self.width(), self.height())
@@ -1038,3 +1136,18 @@ class MainWindow(QMainWindow):
             self.serial.disconnect()
 
         event.accept()
+
+    def _on_close_prompt_finished(self, result: int):
+        """Handle answer to the exit confirmation shown while running."""
+        clicked = self._close_prompt.standardButton(self._close_prompt.clickedButton())
+        if clicked != QMessageBox.Yes:
+            return
+
+        # Stop experiment
+        try:
+            self.current_experiment.stop()
+        except:
+            pass
+
+        self._close_confirmed = True
+        self.close()
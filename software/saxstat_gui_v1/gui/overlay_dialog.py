@@ -10,6 +10,11 @@ from PyQt5.QtWidgets import (
 )
 from PyQt5.QtCore import Qt
 from typing import List, Dict, Any
+from itertools import islice
+
+
+# Timestamp format shown in the history list
+_TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
 
 
 class OverlayDialog(QDialog):
@@ -33,6 +38,8 @@ class OverlayDialog(QDialog):
         super().__init__(parent)
 
         self.history_summary = history_summary
+        # History index -> summary, for formatting tooltips on demand
+        self._summary_by_index = {s['index']: s for s in history_summary}
         self.selected_indices: List[int] = []
 
         self.setWindowTitle("Compare Experiments")
@@ -59,6 +66,9 @@ class OverlayDialog(QDialog):
 
         self.experiment_list = QListWidget()
         self.experiment_list.setSelectionMode(QListWidget.MultiSelection)
+        self.experiment_list.setMouseTracking(True)
+        self.experiment_list.itemEntered.connect(self._update_param_tooltip)
+        self.experiment_list.currentItemChanged.connect(self._update_param_tooltip)
 
         # Populate list
         self._populate_list()
@@ -100,6 +110,7 @@ class OverlayDialog(QDialog):
 
     def _populate_list(self):
         """Populate experiment list with history."""
+        items = []
         for summary in reversed(self.history_summary):  # Most recent first
             # Format: "CV - 2024-03-15 14:30:25 (250 points)"
             exp_name = summary['experiment_name']
@@ -107,23 +118,37 @@ class OverlayDialog(QDialog):
             data_points = summary['data_points']
 
             if start_time:
-                time_str = start_time.strftime('%Y-%m-%d %H:%M:%S')
+                time_str = start_time.strftime(_TIME_FORMAT)
             else:
                 time_str = 'Unknown time'
 
-            # Get parameter summary
-            params = summary.get('parameters', {})
-            param_str = ', '.join([f"{k}={v}" for k, v in list(params.items())[:3]])
-            if len(params) > 3:
-                param_str += "..."
-
             text = f"{exp_name} - {time_str} ({data_points} pts)"
-            if param_str:
-                text += f"\n  Parameters: {param_str}"
 
             item = QListWidgetItem(text)
-            item.setData(Qt.UserRole, summary['index'])  # Store index
+            item.setData(Qt.UserRole, summary['index'])  # Store index (tooltip is formatted lazily)
+            items.append(item)
+
+        # Insert all items with signals and repaints suspended
+        self.experiment_list.setUpdatesEnabled(False)
+        self.experiment_list.blockSignals(True)
+        for item in items:
             self.experiment_list.addItem(item)
+        self.experiment_list.blockSignals(False)
+        self.experiment_list.setUpdatesEnabled(True)
+
+    def _update_param_tooltip(self, item: QListWidgetItem, *args):
+        """Format the parameter summary tooltip for an item on first use."""
+        if item is None or item.toolTip():
+            return
+
+        summary = self._summary_by_index.get(item.data(Qt.UserRole), {})
+        params = summary.get('parameters') or {}
+        param_str = ', '.join(f"{k}={v}" for k, v in islice(params.items(), 3))
+        if len(params) > 3:
+            param_str += "..."
+
+        if param_str:
+            item.setToolTip(f"Parameters: {param_str}")
 
     def _on_apply_clicked(self):
         """Handle apply button click."""
@@ -7,15 +7,91 @@ Dynamic parameter input panel that adapts to selected experiment type.
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QFormLayout,
     QLabel, QLineEdit, QSpinBox, QDoubleSpinBox, QPushButton,
-    QGroupBox, QMessageBox, QComboBox, QInputDialog
+    QGroupBox, QMessageBox, QComboBox, QInputDialog, QDataWidgetMapper
 )
-from PyQt5.QtCore import pyqtSignal
-from typing import Dict, Any, Optional
+from PyQt5.QtCore import (
+    pyqtSignal, Qt, QTimer, QSignalBlocker, QObject, QRunnable, QThreadPool
+)
+from PyQt5.QtGui import QStandardItemModel, QStandardItem
+from typing import Dict, Any, Optional, List, Tuple
+from bisect import bisect_left
 
 from ..experiments import BaseExperiment
 from ..config.config_manager import ConfigManager
 
 
+def _make_spinbox(default: int, min_val: Optional[int], max_val: Optional[int],
+                  widget: Optional[QSpinBox] = None) -> QSpinBox:
+    """Create an integer spin box, or reconfigure a pooled one."""
+    if widget is None:
+        widget = QSpinBox()
+    widget.setRange(
+        min_val if min_val is not None else 0,
+        max_val if max_val is not None else 99
+    )
+    widget.setValue(default)
+    return widget
+
+
+def _make_dspinbox(default: float, min_val: Optional[float], max_val: Optional[float],
+                   widget: Optional[QDoubleSpinBox] = None) -> QDoubleSpinBox:
+    """Create a double spin box with 3 decimals, or reconfigure a pooled one."""
+    if widget is None:
+        widget = QDoubleSpinBox()
+        widget.setDecimals(3)
+        widget.setSingleStep(0.01)
+    widget.setRange(
+        min_val if min_val is not None else 0.0,
+        max_val if max_val is not None else 99.99
+    )
+    widget.setValue(default)
+    return widget
+
+
+def _make_lineedit(default: Any, min_val: Any = None, max_val: Any = None,
+                   widget: Optional[QLineEdit] = None) -> QLineEdit:
+    """Create a line edit, or reconfigure a pooled one (min/max are ignored)."""
+    if widget is None:
+        widget = QLineEdit()
+    widget.setText(str(default))
+    return widget
+
+
+# Parameter type -> input widget factory
+_WIDGET_FACTORIES = {
+    int: _make_spinbox,
+    float: _make_dspinbox,
+    str: _make_lineedit,
+}
+
+
+class _PresetIOSignals(QObject):
+    """Signals emitted by background preset tasks."""
+
+    finished = pyqtSignal(str, str, str, bool)  # action, experiment name, preset name, success
+
+
+class _PresetIOTask(QRunnable):
+    """Write a config snapshot taken on the GUI thread to disk off the GUI thread."""
+
+    def __init__(self, signals: _PresetIOSignals, action: str, exp_name: str,
+                 preset_name: str, config: ConfigManager, snapshot: Tuple[int, str]):
+        super().__init__()
+        self.signals = signals
+        self.action = action
+        self.exp_name = exp_name
+        self.preset_name = preset_name
+        self.config = config
+        self.snapshot = snapshot
+
+    def run(self):
+        ok = False
+        try:
+            ok = self.config.write_snapshot(*self.snapshot)
+        finally:
+            self.signals.finished.emit(self.action, self.exp_name, self.preset_name, ok)
+
+
 class ParameterPanel(QWidget):
     """
     Dynamic parameter input panel for experiments.
@@ -33,6 +109,10 @@ class ParameterPanel(QWidget):
 
     parameters_configured = pyqtSignal(dict)  # {parameter_name: value}
 
+    # Flattened parameter schema per experiment class:
+    # [(param_name, label_text, param_type, default, min_val, max_val), ...]
+    _schema_cache: Dict[type, List[Tuple]] = {}
+
     def __init__(self, config_manager: ConfigManager = None, parent=None):
         super().__init__(parent)
 
@@ -40,6 +120,35 @@ class ParameterPanel(QWidget):
         self.experiment: Optional[BaseExperiment] = None
         self.input_widgets: Dict[str, QWidget] = {}
 
+        # Detached input widgets kept for reuse, keyed by parameter type
+        self._pool: Dict[type, List[QWidget]] = {t: [] for t in _WIDGET_FACTORIES}
+
+        # Parameter values live in a one-column model (one row per parameter)
+        # that the input widgets are bound to through a data widget mapper
+        self._model = QStandardItemModel(self)
+        self._mapper = QDataWidgetMapper(self)
+        self._mapper.setModel(self._model)
+        self._mapper.setOrientation(Qt.Vertical)
+        self._param_rows: Dict[str, Tuple[int, type]] = {}  # name -> (row, type)
+
+        # Presets per experiment name, invalidated on save/delete
+        self._presets_cache: Dict[str, dict] = {}
+        self._preset_order: List[str] = []  # Sorted names shown in the combo
+
+        # Preset save/delete run on the thread pool and report back here
+        self._preset_io_signals = _PresetIOSignals(self)
+        self._preset_io_signals.finished.connect(self._on_preset_io_finished)
+
+        # Preset dialogs, created on first use and reused afterwards
+        self._save_dialog: Optional[QInputDialog] = None
+        self._delete_confirm: Optional[QMessageBox] = None
+
+        # Debounced validation while parameters are being edited
+        self._validate_timer = QTimer(self)
+        self._validate_timer.setSingleShot(True)
+        self._validate_timer.setInterval(150)
+        self._validate_timer.timeout.connect(self._run_validation)
+
         self._init_ui()
 
     def _init_ui(self):
@@ -50,30 +159,37 @@ class ParameterPanel(QWidget):
         # Parameter group box
         self.param_group = QGroupBox("Experiment Parameters")
         param_group_layout = QVBoxLayout()
+        self._param_group_layout = param_group_layout
 
-        # Preset controls
-        preset_layout = QHBoxLayout()
-        preset_layout.addWidget(QLabel("Preset:"))
+        # Preset controls (only when presets can be stored)
+        self.preset_combo: Optional[QComboBox] = None
+        self.save_preset_btn: Optional[QPushButton] = None
+        self.delete_preset_btn: Optional[QPushButton] = None
 
-        self.preset_combo = QComboBox()
-        self.preset_combo.currentTextChanged.connect(self._on_preset_selected)
-        preset_layout.addWidget(self.preset_combo)
+        if self.config is not None:
+            preset_layout = QHBoxLayout()
+            preset_layout.addWidget(QLabel("Preset:"))
 
-        self.save_preset_btn = QPushButton("Save")
-        self.save_preset_btn.clicked.connect(self._on_save_preset_clicked)
-        self.save_preset_btn.setEnabled(False)
-        preset_layout.addWidget(self.save_preset_btn)
+            self.preset_combo = QComboBox()
+            self.preset_combo.currentTextChanged.connect(self._on_preset_selected)
+            preset_layout.addWidget(self.preset_combo)
 
-        self.delete_preset_btn = QPushButton("Delete")
-        self.delete_preset_btn.clicked.connect(self._on_delete_preset_clicked)
-        self.delete_preset_btn.setEnabled(False)
-        preset_layout.addWidget(self.delete_preset_btn)
+            self.save_preset_btn = QPushButton("Save")
+            self.save_preset_btn.clicked.connect(self._on_save_preset_clicked)
+            self.save_preset_btn.setEnabled(False)
+            preset_layout.addWidget(self.save_preset_btn)
+
+            self.delete_preset_btn = QPushButton("Delete")
+            self.delete_preset_btn.clicked.connect(self._on_delete_preset_clicked)
+            self.delete_preset_btn.setEnabled(False)
+            preset_layout.addWidget(self.delete_preset_btn)
 
-        param_group_layout.addLayout(preset_layout)
+            param_group_layout.addLayout(preset_layout)
 
-        # Form layout for parameters
-        self.param_layout = QFormLayout()
-        param_group_layout.addLayout(self.param_layout)
+        # Form layout for parameters (inside a container that is replaced
+        # wholesale when inputs are cleared)
+        self.param_container = self._create_param_container()
+        param_group_layout.addWidget(self.param_container)
 
         # Configure button inside the group box
         self.configure_btn = QPushButton("Configure Experiment")
@@ -85,13 +201,24 @@ class ParameterPanel(QWidget):
         layout.addWidget(self.param_group)
         layout.addStretch()
 
-    def set_experiment(self, experiment: BaseExperiment):
+    def set_experiment(self, experiment: BaseExperiment, force_rebuild: bool = False):
         """
         Set the current experiment and rebuild parameter inputs.
 
+        If the experiment has the same class as the current one, the
+        existing inputs (and their values) are kept unless force_rebuild
+        is set.
+
         Args:
             experiment: Experiment instance
+            force_rebuild: Rebuild inputs even for the same experiment class
         """
+        # Same experiment class means the same (cached) schema: keep the form
+        if (not force_rebuild and experiment is not None and self.experiment is not None
+                and type(experiment) is type(self.experiment) and self.input_widgets):
+            self.experiment = experiment
+            return
+
         self.experiment = experiment
 
         # Clear existing inputs
@@ -99,126 +226,231 @@ class ParameterPanel(QWidget):
 
         if experiment is None:
             self.configure_btn.setEnabled(False)
-            self.save_preset_btn.setEnabled(False)
-            self.delete_preset_btn.setEnabled(False)
+            if self.config is not None:
+                self.save_preset_btn.setEnabled(False)
+                self.delete_preset_btn.setEnabled(False)
             return
 
-        # Get parameter schema
-        params = experiment.get_parameters()
+        # Create input widgets based on schema, relaying out once at the end
+        self.setUpdatesEnabled(False)
+        self.param_container.blockSignals(True)
 
-        # Create input widgets based on schema
-        for param_name, param_def in params.items():
-            widget = self._create_input_widget(param_name, param_def)
+        for param_name, label, param_type, default, min_val, max_val in self._get_schema(experiment):
+            widget = self._create_input_widget(param_type, default, min_val, max_val)
             if widget:
                 self.input_widgets[param_name] = widget
+                self.param_layout.addRow(label, widget)
+                widget.show()  # Pooled widgets are hidden when detached
+
+                # Bind widget to its model row
+                row = self._model.rowCount()
+                item = QStandardItem()
+                item.setData(param_type(default), Qt.EditRole)
+                self._model.appendRow(item)
+                self._mapper.addMapping(widget, row)
+                self._param_rows[param_name] = (row, param_type)
+
+                # Re-validate shortly after the user stops editing
+                self._edit_signal(widget).connect(self._schedule_validation)
+
+        self._mapper.toFirst()
+
+        self.param_container.blockSignals(False)
+        self.setUpdatesEnabled(True)
+        self.updateGeometry()
+
+        self.configure_btn.setEnabled(True)
+
+        if self.config is not None:
+            self.save_preset_btn.setEnabled(True)
+
+            # Load presets for this experiment
+            self._load_presets()
 
+    @classmethod
+    def _get_schema(cls, experiment: BaseExperiment) -> List[Tuple]:
+        """
+        Get the flattened parameter schema for an experiment's class.
+
+        The schema is read from the experiment once per class and cached.
+
+        Args:
+            experiment: Experiment instance
+
+        Returns:
+            list: (param_name, label_text, param_type, default, min_val, max_val) tuples
+        """
+        key = type(experiment)
+        schema = cls._schema_cache.get(key)
+
+        if schema is None:
+            schema = []
+            for param_name, param_def in experiment.get_parameters().items():
                 # Create label with unit
                 label = param_def.get('description', param_name)
                 unit = param_def.get('unit', '')
                 if unit:
                     label = f"{label} ({unit})"
 
-                self.param_layout.addRow(label, widget)
+                schema.append((
+                    param_name,
+                    label,
+                    param_def.get('type', float),
+                    param_def.get('default', 0),
+                    param_def.get('min', None),
+                    param_def.get('max', None)
+                ))
+            cls._schema_cache[key] = schema
 
-        self.configure_btn.setEnabled(True)
-        self.save_preset_btn.setEnabled(True)
+        return schema
 
-        # Load presets for this experiment
-        self._load_presets()
-
-    def _create_input_widget(self, param_name: str, param_def: Dict[str, Any]) -> Optional[QWidget]:
+    def _create_input_widget(self, param_type: type, default: Any,
+                             min_val: Any = None, max_val: Any = None) -> Optional[QWidget]:
         """
         Create appropriate input widget based on parameter definition.
 
         Args:
-            param_name: Parameter name
-            param_def: Parameter definition dict
+            param_type: Parameter type (int, float, str)
+            default: Default value
+            min_val: Minimum value (None for no limit)
+            max_val: Maximum value (None for no limit)
 
         Returns:
             QWidget: Input widget
         """
-        param_type = param_def.get('type', float)
-        default = param_def.get('default', 0)
-        min_val = param_def.get('min', None)
-        max_val = param_def.get('max', None)
-
-        widget = None
-
-        if param_type == int:
-            # Integer spin box
-            widget = QSpinBox()
-            widget.setValue(default)
-            if min_val is not None:
-                widget.setMinimum(min_val)
-            if max_val is not None:
-                widget.setMaximum(max_val)
-
-        elif param_type == float:
-            # Double spin box
-            widget = QDoubleSpinBox()
-            widget.setValue(default)
-            widget.setDecimals(3)
-            widget.setSingleStep(0.01)
-            if min_val is not None:
-                widget.setMinimum(min_val)
-            if max_val is not None:
-                widget.setMaximum(max_val)
-
-        elif param_type == str:
-            # Line edit
-            widget = QLineEdit()
-            widget.setText(str(default))
-
-        return widget
+        factory = _WIDGET_FACTORIES.get(param_type)
+        if factory is None:
+            return None
+
+        # Reconfigure a pooled widget of the same type when one is available
+        pool = self._pool[param_type]
+        return factory(default, min_val, max_val, pool.pop() if pool else None)
+
+    @staticmethod
+    def _edit_signal(widget: QWidget):
+        """Return the signal emitted when an input widget's value is edited."""
+        return widget.textChanged if isinstance(widget, QLineEdit) else widget.valueChanged
+
+    def _create_param_container(self) -> QWidget:
+        """Create an empty container widget holding a new parameter form layout."""
+        container = QWidget()
+        self.param_layout = QFormLayout(container)
+        self.param_layout.setContentsMargins(0, 0, 0, 0)
+        return container
 
     def _clear_inputs(self):
         """Clear all parameter input widgets."""
-        # Remove all rows from form layout
-        while self.param_layout.rowCount() > 0:
-            self.param_layout.removeRow(0)
+        self._mapper.clearMapping()
+        self._model.clear()
+
+        if not self.input_widgets:
+            self._param_rows.clear()
+            return
+
+        self.param_group.setUpdatesEnabled(False)
+
+        # Detach input widgets so they survive the container and can be reused
+        for param_name, widget in self.input_widgets.items():
+            self._edit_signal(widget).disconnect(self._schedule_validation)
+            widget.setParent(None)
+            self._pool[self._param_rows[param_name][1]].append(widget)
+        self._param_rows.clear()
+
+        # Swap in a fresh container instead of removing rows one by one;
+        # deleting the old container disposes of the remaining labels at once
+        old_container = self.param_container
+        self.param_container = self._create_param_container()
+        self._param_group_layout.replaceWidget(old_container, self.param_container)
+        old_container.hide()
+        old_container.deleteLater()
+
+        self.param_group.setUpdatesEnabled(True)
 
         self.input_widgets.clear()
 
     def get_parameters(self) -> Dict[str, Any]:
         """
-        Get current parameter values from input widgets.
+        Get current parameter values from the parameter model.
 
         Returns:
             dict: Parameter values
         """
-        params = {}
+        # Commit any edit still pending in a focused widget
+        self._mapper.submit()
 
-        for param_name, widget in self.input_widgets.items():
-            if isinstance(widget, QSpinBox):
-                params[param_name] = widget.value()
-            elif isinstance(widget, QDoubleSpinBox):
-                params[param_name] = widget.value()
-            elif isinstance(widget, QLineEdit):
-                params[param_name] = widget.text()
+        return {
+            param_name: self._model.item(row, 0).data(Qt.EditRole)
+            for param_name, (row, _) in self._param_rows.items()
+        }
 
-        return params
+    def _read_widget_values(self) -> Dict[str, Any]:
+        """
+        Read parameter values straight from the input widgets.
+
+        Used by live validation: unlike get_parameters() this doesn't
+        submit through the mapper, which would write the value back into
+        the widget being edited and reformat its text mid-typing.
+
+        Returns:
+            dict: Parameter values
+        """
+        return {
+            param_name: widget.text() if isinstance(widget, QLineEdit) else widget.value()
+            for param_name, widget in self.input_widgets.items()
+        }
+
+    def _schedule_validation(self, *args):
+        """Restart the validation debounce timer after an edit."""
+        self._validate_timer.start()
+
+    def _run_validation(self, show_errors: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Validate the current parameter values.
+
+        Live (debounced) validation only reports errors through the
+        configure button tooltip; a warning dialog is shown on request.
+
+        Args:
+            show_errors: Show a warning dialog if validation fails
+
+        Returns:
+            dict or None: Parameter values if valid, None otherwise
+        """
+        self._validate_timer.stop()
 
-    def _on_configure_clicked(self):
-        """Handle configure button click."""
         if self.experiment is None:
-            return
+            return None
 
-        # Get parameter values
-        params = self.get_parameters()
+        # Get parameter values; only an explicit check commits the mapper
+        params = self.get_parameters() if show_errors else self._read_widget_values()
 
         # Validate parameters
         try:
             if self.experiment.validate_parameters(params):
-                # Emit signal with validated parameters
-                self.parameters_configured.emit(params)
+                self.configure_btn.setToolTip("")
+                return params
 
         except ValueError as e:
-            # Show validation error
-            QMessageBox.warning(
-                self,
-                "Invalid Parameters",
-                f"Parameter validation failed:\n{str(e)}"
-            )
+            self.configure_btn.setToolTip(f"Parameter validation failed:\n{str(e)}")
+
+            if show_errors:
+                # Show validation error
+                QMessageBox.warning(
+                    self,
+                    "Invalid Parameters",
+                    f"Parameter validation failed:\n{str(e)}"
+                )
+
+        return None
+
+    def _on_configure_clicked(self):
+        """Handle configure button click."""
+        # Validate immediately, flushing any pending debounced check
+        params = self._run_validation(show_errors=True)
+
+        if params is not None:
+            # Emit signal with validated parameters
+            self.parameters_configured.emit(params)
 
     def set_enabled(self, enabled: bool):
         """
@@ -232,22 +464,35 @@ class ParameterPanel(QWidget):
 
     def set_parameters(self, parameters: Dict[str, Any]):
         """
-        Set parameter values in the input widgets.
+        Set parameter values; bound input widgets update from the model.
 
         Args:
             parameters: Dictionary of parameter_name -> value
         """
         for param_name, value in parameters.items():
-            if param_name in self.input_widgets:
-                widget = self.input_widgets[param_name]
-
-                if isinstance(widget, (QSpinBox, QDoubleSpinBox)):
-                    widget.setValue(value)
-                elif isinstance(widget, QLineEdit):
-                    widget.setText(str(value))
+            entry = self._param_rows.get(param_name)
+            if entry is not None:
+                row, param_type = entry
+                self._model.setData(self._model.index(row, 0), param_type(value), Qt.EditRole)
 
     # Preset management
 
+    def _get_presets(self, exp_name: str) -> dict:
+        """
+        Get presets for an experiment, reading from config only on a cache miss.
+
+        Args:
+            exp_name: Experiment name
+
+        Returns:
+            dict: preset_name -> parameters
+        """
+        presets = self._presets_cache.get(exp_name)
+        if presets is None:
+            presets = self.config.get_presets(exp_name)
+            self._presets_cache[exp_name] = presets
+        return presets
+
     def _load_presets(self):
         """Load presets for current experiment into combo box."""
         if not self.config or not self.experiment:
@@ -256,19 +501,16 @@ class ParameterPanel(QWidget):
         # Get experiment name
         exp_name = self.experiment.get_name()
 
-        # Clear combo box
-        self.preset_combo.blockSignals(True)
+        # Clear combo box (signals blocked until the blocker is released)
+        blocker = QSignalBlocker(self.preset_combo)
         self.preset_combo.clear()
 
-        # Add default option
-        self.preset_combo.addItem("-- Select Preset --")
-
-        # Load presets from config
-        presets = self.config.get_presets(exp_name)
-        for preset_name in sorted(presets.keys()):
-            self.preset_combo.addItem(preset_name)
+        # Add default option and presets (cached per experiment) in one batch
+        presets = self._get_presets(exp_name)
+        self._preset_order = sorted(presets.keys())
+        self.preset_combo.addItems(["-- Select Preset --"] + self._preset_order)
 
-        self.preset_combo.blockSignals(False)
+        blocker.unblock()
 
         # Enable/disable delete button
         self.delete_preset_btn.setEnabled(False)
@@ -284,7 +526,7 @@ class ParameterPanel(QWidget):
 
         # Load preset parameters
         exp_name = self.experiment.get_name()
-        parameters = self.config.load_preset(exp_name, preset_name)
+        parameters = self._get_presets(exp_name).get(preset_name)
 
         if parameters:
             # Apply parameters to widgets
@@ -297,35 +539,24 @@ class ParameterPanel(QWidget):
             return
 
         # Get preset name from user
-        name, ok = QInputDialog.getText(
-            self,
-            "Save Preset",
-            "Enter preset name:",
-            QLineEdit.Normal,
-            ""
-        )
+        if self._save_dialog is None:
+            self._save_dialog = QInputDialog(self)
+            self._save_dialog.setInputMode(QInputDialog.TextInput)
+            self._save_dialog.setWindowTitle("Save Preset")
+            self._save_dialog.setLabelText("Enter preset name:")
+
+        self._save_dialog.setTextValue("")
+        ok = self._save_dialog.exec_() == QInputDialog.Accepted
+        name = self._save_dialog.textValue()
 
         if ok and name:
             # Get current parameters
             parameters = self.get_parameters()
 
-            # Save preset
+            # Update the config here, write it to disk in the background
             exp_name = self.experiment.get_name()
-            self.config.save_preset(exp_name, name, parameters)
-
-            # Reload presets
-            self._load_presets()
-
-            # Select the newly saved preset
-            index = self.preset_combo.findText(name)
-            if index >= 0:
-                self.preset_combo.setCurrentIndex(index)
-
-            QMessageBox.information(
-                self,
-                "Preset Saved",
-                f"Preset '{name}' saved successfully!"
-            )
+            self.config.save_preset(exp_name, name, parameters, auto_save=False)
+            self._start_preset_io('save', exp_name, name)
 
     def _on_delete_preset_clicked(self):
         """Handle delete preset button click."""
@@ -337,22 +568,73 @@ class ParameterPanel(QWidget):
             return
 
         # Confirm deletion
-        reply = QMessageBox.question(
-            self,
-            "Delete Preset",
-            f"Are you sure you want to delete preset '{preset_name}'?",
-            QMessageBox.Yes | QMessageBox.No,
-            QMessageBox.No
-        )
+        if self._delete_confirm is None:
+            self._delete_confirm = QMessageBox(
+                QMessageBox.Question,
+                "Delete Preset",
+                "",
+                QMessageBox.Yes | QMessageBox.No,
+                self
+            )
+            self._delete_confirm.setDefaultButton(QMessageBox.No)
+
+        self._delete_confirm.setText(f"Are you sure you want to delete preset '{preset_name}'?")
+        reply = self._delete_confirm.exec_()
 
         if reply == QMessageBox.Yes:
-            # Delete preset
+            # Update the config here, write it to disk in the background
             exp_name = self.experiment.get_name()
-            self.config.delete_preset(exp_name, preset_name)
+            self.config.delete_preset(exp_name, preset_name, auto_save=False)
+            self._start_preset_io('delete', exp_name, preset_name)
 
-            # Reload presets
-            self._load_presets()
+    def _start_preset_io(self, action: str, exp_name: str, preset_name: str):
+        """
+        Write the already-updated config to disk on the thread pool.
+
+        The config dict is only modified on the GUI thread; the worker
+        receives a serialized snapshot. Preset buttons stay disabled
+        until the task reports back.
+
+        Args:
+            action: 'save' or 'delete'
+            exp_name: Experiment name the preset belongs to
+            preset_name: Preset name
+        """
+        self.save_preset_btn.setEnabled(False)
+        self.delete_preset_btn.setEnabled(False)
+
+        task = _PresetIOTask(self._preset_io_signals, action, exp_name, preset_name,
+                             self.config, self.config.snapshot())
+        QThreadPool.globalInstance().start(task)
+
+    def _on_preset_io_finished(self, action: str, exp_name: str, preset_name: str, ok: bool):
+        """Handle completion of a background preset save/delete."""
+        self._presets_cache.pop(exp_name, None)
+        self.save_preset_btn.setEnabled(self.experiment is not None)
+
+        # Reload presets
+        self._load_presets()
 
+        if not ok:
+            QMessageBox.warning(
+                self,
+                "Preset Error",
+                f"Preset '{preset_name}' could not be written to the config file."
+            )
+            return
+
+        if action == 'save':
+            # Select the newly saved preset (offset by the default option)
+            index = bisect_left(self._preset_order, preset_name)
+            if index < len(self._preset_order) and self._preset_order[index] == preset_name:
+                self.preset_combo.setCurrentIndex(1 + index)
+
+            QMessageBox.information(
+                self,
+                "Preset Saved",
+                f"Preset '{preset_name}' saved successfully!"
+            )
+        else:
             QMessageBox.information(
                 self,
                 "Preset Deleted",
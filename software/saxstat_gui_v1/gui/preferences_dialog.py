@@ -13,6 +13,23 @@ from PyQt5.QtCore import Qt
 from pathlib import Path
 
 
+# Filename pattern choices offered in the autosave settings
+_FILENAME_PATTERNS = (
+    "{experiment}_{timestamp}",
+    "{experiment}_{date}_{time}",
+    "{date}_{experiment}_{time}",
+    "{timestamp}_{experiment}",
+)
+
+_PATTERN_HELP_TEXT = (
+    "Available placeholders:\n"
+    "  {experiment} - Experiment name (CV, LSV, etc.)\n"
+    "  {timestamp} - Full timestamp (YYYY-MM-DD_HH-MM-SS)\n"
+    "  {date} - Date only (YYYY-MM-DD)\n"
+    "  {time} - Time only (HH-MM-SS)"
+)
+
+
 class PreferencesDialog(QDialog):
     """
     Preferences dialog for application settings.
@@ -34,6 +51,7 @@ class PreferencesDialog(QDialog):
         """
         super().__init__(parent)
         self.config = config_manager
+        self._default_browse_root = ''  # Expanded autosave directory, set on load
 
         self.setWindowTitle("Preferences")
         self.setMinimumWidth(500)
@@ -69,24 +87,13 @@ class PreferencesDialog(QDialog):
         pattern_layout = QHBoxLayout()
         pattern_layout.addWidget(QLabel("Filename Pattern:"))
         self.pattern_combo = QComboBox()
-        self.pattern_combo.addItems([
-            "{experiment}_{timestamp}",
-            "{experiment}_{date}_{time}",
-            "{date}_{experiment}_{time}",
-            "{timestamp}_{experiment}"
-        ])
+        self.pattern_combo.addItems(list(_FILENAME_PATTERNS))
         self.pattern_combo.setEditable(True)
         pattern_layout.addWidget(self.pattern_combo)
         autosave_layout.addLayout(pattern_layout)
 
         # Pattern help text
-        help_label = QLabel(
-            "Available placeholders:\n"
-            "  {experiment} - Experiment name (CV, LSV, etc.)\n"
-            "  {timestamp} - Full timestamp (YYYY-MM-DD_HH-MM-SS)\n"
-            "  {date} - Date only (YYYY-MM-DD)\n"
-            "  {time} - Time only (HH-MM-SS)"
-        )
+        help_label = QLabel(_PATTERN_HELP_TEXT)
         help_label.setStyleSheet("color: #666; font-size: 9pt;")
         autosave_layout.addWidget(help_label)
 
@@ -101,6 +108,11 @@ class PreferencesDialog(QDialog):
         format_layout.addWidget(self.format_csv)
         format_layout.addWidget(self.format_json)
         format_layout.addWidget(self.format_excel)
+        self._format_checkboxes = (
+            ('csv', self.format_csv),
+            ('json', self.format_json),
+            ('excel', self.format_excel),
+        )
         format_layout.addStretch()
         autosave_layout.addLayout(format_layout)
 
@@ -120,16 +132,24 @@ class PreferencesDialog(QDialog):
 
     def _load_settings(self):
         """Load current settings from config."""
+        settings = self.config.get_many({
+            'autosave.enabled': True,
+            'autosave.directory': '~/Documents/SaxStat/Data',
+            'autosave.filename_pattern': '{experiment}_{timestamp}',
+            'autosave.formats': ['csv'],
+        })
+
         # Autosave enabled
-        enabled = self.config.get('autosave.enabled', True)
+        enabled = settings['autosave.enabled']
         self.autosave_enabled.setChecked(enabled)
 
-        # Directory
-        directory = self.config.get('autosave.directory', '~/Documents/SaxStat/Data')
+        # Directory (expanded once as the browse dialog's fallback start)
+        directory = settings['autosave.directory']
         self.directory_edit.setText(directory)
+        self._default_browse_root = str(Path(directory).expanduser())
 
         # Filename pattern
-        pattern = self.config.get('autosave.filename_pattern', '{experiment}_{timestamp}')
+        pattern = settings['autosave.filename_pattern']
         index = self.pattern_combo.findText(pattern)
         if index >= 0:
             self.pattern_combo.setCurrentIndex(index)
@@ -137,10 +157,9 @@ class PreferencesDialog(QDialog):
             self.pattern_combo.setCurrentText(pattern)
 
         # Formats
-        formats = self.config.get('autosave.formats', ['csv'])
-        self.format_csv.setChecked('csv' in formats)
-        self.format_json.setChecked('json' in formats)
-        self.format_excel.setChecked('excel' in formats)
+        formats = settings['autosave.formats']
+        for fmt, checkbox in self._format_checkboxes:
+            checkbox.setChecked(fmt in formats)
 
         # Update enabled state
         self._on_autosave_toggled(Qt.Checked if enabled else Qt.Unchecked)
@@ -151,16 +170,17 @@ class PreferencesDialog(QDialog):
         self.directory_edit.setEnabled(enabled)
         self.browse_btn.setEnabled(enabled)
         self.pattern_combo.setEnabled(enabled)
-        self.format_csv.setEnabled(enabled)
-        self.format_json.setEnabled(enabled)
-        self.format_excel.setEnabled(enabled)
+        for _, checkbox in self._format_checkboxes:
+            checkbox.setEnabled(enabled)
 
     def _on_browse_clicked(self):
         """Handle browse button click."""
         current_dir = self.directory_edit.text()
 
-        # Expand ~ if present
-        if current_dir.startswith('~'):
+        # Fall back to the configured directory; expand ~ only for edited paths
+        if not current_dir:
+            current_dir = self._default_browse_root
+        elif current_dir.startswith('~'):
             current_dir = str(Path(current_dir).expanduser())
 
         directory = QFileDialog.getExistingDirectory(
@@ -176,9 +196,7 @@ class PreferencesDialog(QDialog):
         """Handle OK button click - validate and save settings."""
         # Validate at least one format is selected
         if self.autosave_enabled.isChecked():
-            if not (self.format_csv.isChecked() or
-                    self.format_json.isChecked() or
-                    self.format_excel.isChecked()):
+            if not any(checkbox.isChecked() for _, checkbox in self._format_checkboxes):
                 QMessageBox.warning(
                     self,
                     "Invalid Configuration",
@@ -192,22 +210,13 @@ class PreferencesDialog(QDialog):
 
     def _save_settings(self):
         """Save settings to config."""
-        # Autosave enabled
-        self.config.set('autosave.enabled', self.autosave_enabled.isChecked())
-
-        # Directory
-        self.config.set('autosave.directory', self.directory_edit.text())
-
-        # Filename pattern
-        self.config.set('autosave.filename_pattern', self.pattern_combo.currentText())
-
         # Formats
-        formats = []
-        if self.format_csv.isChecked():
-            formats.append('csv')
-        if self.format_json.isChecked():
-            formats.append('json')
-        if self.format_excel.isChecked():
-            formats.append('excel')
-
-        self.config.set('autosave.formats', formats)
+        formats = [fmt for fmt, checkbox in self._format_checkboxes if checkbox.isChecked()]
+
+        # Write all autosave settings with a single save
+        self.config.set_many({
+            'autosave.enabled': self.autosave_enabled.isChecked(),
+            'autosave.directory': self.directory_edit.text(),
+            'autosave.filename_pattern': self.pattern_combo.currentText(),
+            'autosave.formats': formats,
+        })
@@ -6,15 +6,25 @@ This module initializes and launches the SaxStat GUI application.
 
 import sys
 from PyQt5.QtWidgets import QApplication
-from saxstat_gui_v1.gui.main_window import MainWindow
+from PyQt5.QtCore import Qt
 
 
 def main():
     """Launch the SaxStat GUI application."""
+    # Application attributes must be set before QApplication is created
+    QApplication.setAttribute(Qt.AA_ShareOpenGLContexts, True)
+    QApplication.setAttribute(Qt.AA_DontCreateNativeWidgetSiblings, True)
+    QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
+
     app = QApplication(sys.argv)
     app.setApplicationName("SaxStat")
     app.setApplicationVersion("1.2.0")
     app.setOrganizationName("SaxStat")
+    app.processEvents()
+
+    # Import the main window only once the application exists, so the
+    # heavy GUI/plotting imports don't delay QApplication start-up
+    from saxstat_gui_v1.gui.main_window import MainWindow
 
     window = MainWindow()
     window.show()
@@ -4,11 +4,130 @@ Plot Manager
 Manages real-time plotting with pyqtgraph for high performance.
 """
 
+import sys
+
 import pyqtgraph as pg
+import pyqtgraph.exporters
 from pyqtgraph import PlotWidget
-from typing import List, Tuple, Optional
+from PyQt5.QtCore import Qt, QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+from PyQt5.QtGui import QFont, QImage, QPen
+from PyQt5.QtWidgets import QGraphicsItem
+from typing import Dict, List, Optional, Tuple
 import numpy as np
 
+# Antialiased lines go through Qt's slow stroker; keep them off globally
+pg.setConfigOptions(antialias=False)
+
+
+def _to_float_array(values) -> np.ndarray:
+    """
+    Convert a batch of coordinates to a 1-D array without extra copies.
+
+    NumPy arrays are returned as-is (slice assignment into the float64
+    buffers converts them); other iterables go through ``np.fromiter``,
+    which fills a preallocated array when the length is known.
+    """
+    if isinstance(values, np.ndarray):
+        return values.ravel()
+    try:
+        count = len(values)
+    except TypeError:
+        count = -1
+    return np.fromiter(values, dtype=np.float64, count=count)
+
+
+def _as_plot_array(values, copy: bool) -> np.ndarray:
+    """
+    Convert data passed to ``set_data`` to a contiguous float64 array.
+
+    When the result would share memory with a caller's ndarray, a
+    read-only view is returned so the plot can never write into it.
+    """
+    if copy:
+        return np.array(values, dtype=np.float64)
+
+    arr = np.ascontiguousarray(values, dtype=np.float64)
+    if isinstance(values, np.ndarray) and np.may_share_memory(arr, values):
+        arr = arr.view()
+        arr.flags.writeable = False
+    return arr
+
+
+def downsample_m4(x: np.ndarray, y: np.ndarray,
+                  n_bins: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce a curve with M4 downsampling.
+
+    The samples are split into ``n_bins`` consecutive bins and only the
+    first, minimum, maximum and last point of each bin are kept, in their
+    original order. Peaks survive and X does not need to be sorted, so it
+    also works for sweeps that go back and forth in X.
+
+    Args:
+        x: X data
+        y: Y data (same length as x)
+        n_bins: Number of bins, typically the plot width in pixels
+
+    Returns:
+        Tuple of (x, y) arrays; the inputs are returned unchanged when
+        they already have no more than 4 points per bin
+    """
+    n = len(y)
+    if n_bins < 1 or n <= 4 * n_bins:
+        return x, y
+
+    # Round the bin size up so leftovers never exceed one bin
+    size = -(-n // n_bins)
+    full = n // size
+    m = size * full
+    bins = y[:m].reshape(full, size)
+    starts = np.arange(0, m, size)
+
+    idx = np.column_stack((
+        starts,
+        starts + bins.argmin(axis=1),
+        starts + bins.argmax(axis=1),
+        starts + size - 1,
+    ))
+    idx.sort(axis=1)
+    idx = idx.ravel()
+
+    # Leftover samples form one last, shorter bin
+    if m < n:
+        tail = y[m:]
+        idx = np.concatenate((idx, np.sort(
+            [m, m + tail.argmin(), m + tail.argmax(), n - 1])))
+
+    # Indices are non-decreasing; drop repeats (e.g. first == min)
+    keep = np.empty(len(idx), dtype=bool)
+    keep[0] = True
+    np.not_equal(idx[1:], idx[:-1], out=keep[1:])
+    idx = idx[keep]
+    return x[idx], y[idx]
+
+
+class _ExportSignals(QObject):
+    """Signals emitted when a plot image export finishes."""
+
+    finished = pyqtSignal(str, bool)  # File path, success
+
+
+class _ImageSaveTask(QRunnable):
+    """Encode and write a rendered plot image off the GUI thread."""
+
+    def __init__(self, image: QImage, filepath: str, signals: _ExportSignals):
+        super().__init__()
+        self.image = image
+        self.filepath = filepath
+        self.signals = signals
+
+    def run(self):
+        ok = False
+        try:
+            ok = self.image.save(self.filepath)
+        finally:
+            self.signals.finished.emit(self.filepath, ok)
+
 
 class PlotManager:
     """
@@ -22,53 +141,123 @@ class PlotManager:
     - Export to image
     """
 
-    def __init__(self, plot_widget: PlotWidget):
+    # Axis label style and tick font shared by all plots
+    _LABEL_STYLE = {'color': '#212121', 'font-size': '12pt', 'font-family': 'Arial'}
+    _TICK_FONT: Optional[QFont] = None
+
+    # Pens shared by all plots, keyed by (color, width, style)
+    _pen_cache: Dict[tuple, QPen] = {}
+
+    # Initial buffer size; doubled whenever an append would overflow it
+    _INITIAL_CAPACITY = 1024
+
+    # Lower bound on M4 bins so a not-yet-shown widget isn't over-reduced
+    _M4_MIN_BINS = 512
+
+    # Point count above which Windows builds switch the view to OpenGL
+    _OPENGL_THRESHOLD = 50_000
+
+    # Minimum time between redraws while streaming (~30 Hz)
+    _REDRAW_INTERVAL_MS = 33
+
+    def __init__(self, plot_widget: PlotWidget, x_label: str = 'X Axis',
+                 y_label: str = 'Y Axis', title: str = '',
+                 monotonic_x: bool = False):
         """
         Initialize plot manager.
 
         Args:
             plot_widget: PyQtGraph PlotWidget instance
+            x_label: Initial X-axis label
+            y_label: Initial Y-axis label
+            title: Initial plot title
+            monotonic_x: True if X always increases (e.g. time), which
+                enables viewport clipping and automatic downsampling
         """
         self.widget = plot_widget
         self.plot_item = self.widget.getPlotItem()
 
-        # Data storage
-        self.x_data: List[float] = []
-        self.y_data: List[float] = []
+        # Data storage: preallocated buffers, only the first _n entries are valid
+        self._xbuf = np.empty(self._INITIAL_CAPACITY, dtype=np.float64)
+        self._ybuf = np.empty(self._INITIAL_CAPACITY, dtype=np.float64)
+        self._n = 0
+        self._borrowed = False  # Buffers alias arrays passed to set_data()
+        self._last_drawn_n = 0  # Points the curve was last drawn with
+        self._x_monotonic = False
+
+        # Streaming: fixed ranges from running data bounds, no auto-range
+        self._streaming = False
+        self._follow_bounds = False  # Cleared when the user pans/zooms
+        self._reset_bounds()
+        self.plot_item.getViewBox().sigRangeChangedManually.connect(
+            self._on_range_changed_manually)
+
+        # OpenGL viewport, only used for very long curves on Windows
+        self._opengl = False
+        self._opengl_available = sys.platform == 'win32'
+
+        # Coalesce redraws: appends mark the plot dirty, the timer draws once
+        self._dirty = False
+        self._redraw_timer = QTimer(self.widget)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.setInterval(self._REDRAW_INTERVAL_MS)
+        self._redraw_timer.timeout.connect(self._flush)
+
+        # Background image export; connect to export_finished for the result
+        self._export_signals = _ExportSignals(self.widget)
+        self.export_finished = self._export_signals.finished
 
         # Plot curves
-        self.curve: Optional[pg.PlotDataItem] = None
         self.overlay_curves: List[pg.PlotDataItem] = []  # Overlay curves for comparison
+        self._overlay_pool: List[pg.PlotDataItem] = []  # Hidden curves ready for reuse
 
         # Overlay colors (cycle through for multiple overlays)
         self.overlay_colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#FFA07A', '#98D8C8', '#F7DC6F', '#BB8FCE']
         self.overlay_color_index = 0
 
         # Configure default appearance
-        self._setup_plot()
+        self._setup_plot(x_label, y_label, title)
+        self.set_x_monotonic(monotonic_x)
+
+        # Live data curve, created once and reused for every run.
+        # Instrument samples are always finite, so skip pyqtgraph's
+        # per-redraw isfinite() scan and build the path as one polyline.
+        self.curve: pg.PlotDataItem = self.plot_item.plot(
+            np.empty(0), np.empty(0), pen=self._get_pen('b', 1),
+            connect='all', skipFiniteCheck=True
+        )
 
-    def _setup_plot(self):
-        """Configure plot appearance with Arial font."""
-        from PyQt5.QtGui import QFont
+    def _setup_plot(self, x_label: str, y_label: str, title: str = ''):
+        """Configure plot appearance and initial labels with Arial font."""
+        # QFont needs a running QApplication, so build the shared one here
+        if PlotManager._TICK_FONT is None:
+            PlotManager._TICK_FONT = QFont("Arial", 10)
 
-        self.plot_item.showGrid(x=True, y=True, alpha=0.3)
+        self._left_axis = self.widget.getAxis('left')
+        self._bottom_axis = self.widget.getAxis('bottom')
 
-        # Set default labels with Arial font
-        label_style = {'color': '#212121', 'font-size': '12pt', 'font-family': 'Arial'}
-        self.plot_item.setLabel('bottom', 'X Axis', **label_style)
-        self.plot_item.setLabel('left', 'Y Axis', **label_style)
+        self.plot_item.showGrid(x=True, y=True, alpha=0.3)
 
         # Set background color
         self.widget.setBackground('w')
 
-        # Set tick font and colors
-        tick_font = QFont("Arial", 10)
-        self.widget.getAxis('left').setTextPen('#212121')
-        self.widget.getAxis('bottom').setTextPen('#212121')
-        self.widget.getAxis('left').setPen('#424242')
-        self.widget.getAxis('bottom').setPen('#424242')
-        self.widget.getAxis('left').setStyle(tickFont=tick_font)
-        self.widget.getAxis('bottom').setStyle(tickFont=tick_font)
+        # setTitle has no font-family option; set it on the title item once
+        self.plot_item.titleLabel.item.setFont(QFont("Arial"))
+
+        self.set_labels(x_label, y_label, title)
+
+        # Tick font and colors never change afterwards
+        self._apply_axis_style()
+
+    def _apply_axis_style(self):
+        """Apply tick font and axis/text colors to both axes in one pass."""
+        for axis in (self._left_axis, self._bottom_axis):
+            axis.blockSignals(True)
+            axis.setTextPen('#212121')
+            axis.setPen('#424242')
+            axis.setStyle(tickFont=self._TICK_FONT)
+            axis.blockSignals(False)
+            axis.update()
 
     # Plot configuration
 
@@ -81,29 +270,38 @@ class PlotManager:
             y_label: Y-axis label with unit (e.g., 'Current (µA)')
             title: Plot title
         """
-        from PyQt5.QtGui import QFont
-
-        # Create font for tick numbers
-        tick_font = QFont("Arial", 10)
+        self.plot_item.setLabel('bottom', x_label, **self._LABEL_STYLE)
+        self.plot_item.setLabel('left', y_label, **self._LABEL_STYLE)
 
-        # Set labels with CSS-style formatting for Arial font
-        label_style = {'color': '#212121', 'font-size': '12pt', 'font-family': 'Arial'}
+        if title:
+            self.plot_item.setTitle(title, color='#212121', size='13pt', bold=True)
+
+    @classmethod
+    def _get_pen(cls, color: str, width: int,
+                 style: Qt.PenStyle = Qt.SolidLine) -> QPen:
+        """Return a cached pen, building it with ``pg.mkPen`` on first use."""
+        key = (color, width, style)
+        pen = cls._pen_cache.get(key)
+        if pen is None:
+            pen = cls._pen_cache[key] = pg.mkPen(color=color, width=width, style=style)
+        return pen
+
+    def set_x_monotonic(self, monotonic: bool):
+        """
+        Enable pyqtgraph's clip-to-view and automatic peak downsampling.
 
-        self.plot_item.setLabel('bottom', x_label, **label_style)
-        self.plot_item.setLabel('left', y_label, **label_style)
+        Both assume evenly spaced, increasing X values, so they are only
+        turned on for time-based plots. Sweeps that go back and forth in
+        X (e.g. CV) are reduced with ``downsample_m4`` while streaming
+        and drawn in full afterwards.
 
-        if title:
-            # Set title with HTML formatting for Arial font
-            title_html = f'<span style="color: #212121; font-size: 13pt; font-family: Arial; font-weight: bold;">{title}</span>'
-            self.plot_item.setTitle(title_html)
-
-        # Update axis text colors and tick font
-        self.widget.getAxis('left').setTextPen('#212121')
-        self.widget.getAxis('bottom').setTextPen('#212121')
-        self.widget.getAxis('left').setPen('#424242')
-        self.widget.getAxis('bottom').setPen('#424242')
-        self.widget.getAxis('left').setStyle(tickFont=tick_font)
-        self.widget.getAxis('bottom').setStyle(tickFont=tick_font)
+        Args:
+            monotonic: True if X always increases
+        """
+        self._x_monotonic = monotonic
+        self._last_drawn_n = -1  # Redraw with the new reduction
+        self.plot_item.setClipToView(monotonic)
+        self.plot_item.setDownsampling(ds=1, auto=monotonic, mode='peak')
 
     def set_axis_ranges(self, x_range: Tuple[float, float],
                        y_range: Tuple[float, float]):
@@ -126,16 +324,96 @@ class PlotManager:
         """
         self.plot_item.enableAutoRange(enable=enable)
 
+    def set_streaming(self, enabled: bool):
+        """
+        Switch live streaming range handling on or off.
+
+        While streaming, auto-range is disabled and each redraw sets the
+        view to the data bounds tracked as points are appended, avoiding
+        pyqtgraph's full min/max scan of the data on every frame. Once the
+        user pans or zooms, the view is left alone until the auto-range
+        button is pressed. Turning streaming off restores auto-ranging
+        unless the user has moved the view.
+
+        Args:
+            enabled: True while an experiment is acquiring data
+        """
+        self._streaming = enabled
+        if enabled:
+            self._follow_bounds = True
+            self.plot_item.disableAutoRange()
+        else:
+            if self._follow_bounds:
+                self._follow_bounds = False
+                self.plot_item.enableAutoRange()
+
+            # Redraw at full resolution without the live M4 reduction
+            self._last_drawn_n = -1
+            self._schedule_update()
+
+    def _on_range_changed_manually(self, *args):
+        """Stop following the data bounds after a user pan/zoom."""
+        self._follow_bounds = False
+
+    def _reset_bounds(self):
+        """Forget the tracked data bounds."""
+        self._xmin = self._ymin = np.inf
+        self._xmax = self._ymax = -np.inf
+
     # Data management
 
+    @property
+    def x_data(self) -> np.ndarray:
+        """X data as a view into the internal buffer (no copy)."""
+        return self._xbuf[:self._n]
+
+    @property
+    def y_data(self) -> np.ndarray:
+        """Y data as a view into the internal buffer (no copy)."""
+        return self._ybuf[:self._n]
+
+    @property
+    def x_array(self) -> np.ndarray:
+        """X data as a NumPy array (same view as ``x_data``)."""
+        return self.x_data
+
+    def _grow(self, required: int):
+        """
+        Enlarge the buffers to hold at least ``required`` points.
+
+        Capacity doubles until it fits, so appends are amortised O(1).
+        Buffers borrowed from ``set_data`` are always copied first so
+        appends never write into the caller's arrays.
+
+        Args:
+            required: Minimum number of points the buffers must hold
+        """
+        capacity = len(self._xbuf)
+        if required <= capacity and not self._borrowed:
+            return
+
+        capacity = max(capacity, self._INITIAL_CAPACITY)
+        while capacity < required:
+            capacity *= 2
+
+        xbuf = np.empty(capacity, dtype=np.float64)
+        ybuf = np.empty(capacity, dtype=np.float64)
+        xbuf[:self._n] = self._xbuf[:self._n]
+        ybuf[:self._n] = self._ybuf[:self._n]
+        self._xbuf, self._ybuf = xbuf, ybuf
+        self._borrowed = False
+
     def clear(self):
         """Clear all plot data and overlays."""
-        self.x_data.clear()
-        self.y_data.clear()
+        # Keep the buffers allocated; the next run reuses them
+        self._n = 0
+        self._reset_bounds()
+        self._last_drawn_n = 0
+        self._dirty = False
+        self._redraw_timer.stop()
 
-        if self.curve is not None:
-            self.plot_item.removeItem(self.curve)
-            self.curve = None
+        self.curve.setData(np.empty(0), np.empty(0))
+        self._maybe_enable_opengl()
 
         # Clear overlay curves
         self.clear_overlays()
@@ -148,53 +426,158 @@ class PlotManager:
             x: X coordinate
             y: Y coordinate
         """
-        self.x_data.append(x)
-        self.y_data.append(y)
-        self.update()
+        n = self._n
+        if n == len(self._xbuf) or self._borrowed:
+            self._grow(n + 1)
+
+        self._xbuf[n] = x
+        self._ybuf[n] = y
+        self._n = n + 1
+
+        if x < self._xmin:
+            self._xmin = x
+        if x > self._xmax:
+            self._xmax = x
+        if y < self._ymin:
+            self._ymin = y
+        if y > self._ymax:
+            self._ymax = y
+        self._schedule_update()
 
     def add_points(self, x_points: List[float], y_points: List[float]):
         """
         Add multiple data points.
 
         Args:
-            x_points: List of X coordinates
-            y_points: List of Y coordinates
+            x_points: X coordinates (NumPy array or sequence of floats)
+            y_points: Y coordinates (NumPy array or sequence of floats)
         """
-        self.x_data.extend(x_points)
-        self.y_data.extend(y_points)
-        self.update()
+        x = _to_float_array(x_points)
+        y = _to_float_array(y_points)
+        k = min(len(x), len(y))
+        if k == 0:
+            return
+
+        n = self._n
+        self._grow(n + k)
+        self._xbuf[n:n + k] = x[:k]
+        self._ybuf[n:n + k] = y[:k]
+        self._n = n + k
+
+        self._xmin = min(self._xmin, x[:k].min())
+        self._xmax = max(self._xmax, x[:k].max())
+        self._ymin = min(self._ymin, y[:k].min())
+        self._ymax = max(self._ymax, y[:k].max())
+        self._schedule_update()
 
-    def set_data(self, x_data: List[float], y_data: List[float]):
+    def set_data(self, x_data: np.ndarray, y_data: np.ndarray, copy: bool = False):
         """
         Replace all data with new dataset.
 
+        With ``copy=False`` contiguous float64 arrays are plotted through
+        read-only views instead of being copied; the caller must not
+        modify them while they are plotted. Other input is converted
+        once. Pass ``copy=True`` to always take a private copy.
+
         Args:
-            x_data: New X data
+            x_data: New X data (1-D, same length as y_data)
             y_data: New Y data
+            copy: Copy the data even if it could be used in place
+
+        Raises:
+            ValueError: If the data isn't 1-D or the lengths differ
         """
-        self.x_data = list(x_data)
-        self.y_data = list(y_data)
-        self.update()
+        x = _as_plot_array(x_data, copy)
+        y = _as_plot_array(y_data, copy)
+        if x.ndim != 1 or x.shape != y.shape:
+            raise ValueError("x_data and y_data must be 1-D arrays of the same length")
+
+        self._xbuf, self._ybuf, self._n = x, y, len(x)
+        # Read-only views of caller data are copied before the next append
+        self._borrowed = not (x.flags.writeable and y.flags.writeable)
+        self._reset_bounds()
+        if self._n:
+            self._xmin, self._xmax = x.min(), x.max()
+            self._ymin, self._ymax = y.min(), y.max()
+        self._last_drawn_n = -1  # Contents replaced: force a redraw
+        self._schedule_update()
 
     # Plotting
 
+    def _schedule_update(self):
+        """Mark the plot dirty and redraw on the next timer tick."""
+        self._dirty = True
+        if not self._redraw_timer.isActive():
+            self._redraw_timer.start()
+
+    def _flush(self):
+        """Redraw once if data changed since the last tick."""
+        if self._dirty:
+            self._dirty = False
+            self.update()
+
     def update(self):
         """Update the plot with current data."""
-        if not self.x_data or not self.y_data:
+        # Nothing new since the last draw
+        if self._n == 0 or self._n == self._last_drawn_n:
             return
 
-        if self.curve is None:
-            # Create curve on first update
-            self.curve = self.plot_item.plot(
-                self.x_data,
-                self.y_data,
-                pen=pg.mkPen(color='b', width=2)
-            )
-        else:
-            # Update existing curve
-            self.curve.setData(self.x_data, self.y_data)
+        # Buffer views are float64 arrays, pyqtgraph's fast path
+        x = self._xbuf[:self._n]
+        y = self._ybuf[:self._n]
+
+        # pyqtgraph's peak downsampling needs increasing X; otherwise
+        # reduce live frames to about 4 points per horizontal pixel
+        # ourselves (finished runs are redrawn in full)
+        if self._streaming and not self._x_monotonic:
+            n_bins = max(self.widget.width(), self._M4_MIN_BINS)
+            x, y = downsample_m4(x, y, n_bins)
+
+        self._maybe_enable_opengl()
+
+        if self._streaming:
+            if not self._follow_bounds and any(self.plot_item.getViewBox().autoRangeEnabled()):
+                # Auto-range button pressed after a pan/zoom: follow again
+                self._follow_bounds = True
+                self.plot_item.disableAutoRange()
 
-    def set_line_color(self, color: str, width: int = 2):
+            if self._follow_bounds:
+                # Tracked bounds replace the auto-range scan (O(1) per frame)
+                self.plot_item.setRange(xRange=(self._xmin, self._xmax),
+                                        yRange=(self._ymin, self._ymax))
+
+        self.curve.setData(x, y)
+        self._last_drawn_n = self._n
+
+    def _maybe_enable_opengl(self):
+        """
+        Use an OpenGL viewport while the curve is very long.
+
+        Only enabled on Windows, where GPU rasterisation of long paths
+        pays off; elsewhere the QPainter raster engine is faster. Reverts
+        once the data drops back below the threshold (e.g. on clear).
+        """
+        if not self._opengl_available:
+            return
+
+        want = self._n > self._OPENGL_THRESHOLD
+        if want == self._opengl:
+            return
+
+        try:
+            if want:
+                pg.setConfigOption('enableExperimental', True)
+            self.widget.useOpenGL(want)
+        except Exception as e:
+            # Missing PyOpenGL or driver support: stay on raster for good
+            print(f"OpenGL plotting unavailable: {e}")
+            self._opengl_available = False
+            return
+
+        self._opengl = want
+        print(f"OpenGL plotting {'enabled' if want else 'disabled'} ({self._n} points)")
+
+    def set_line_color(self, color: str, width: int = 1):
         """
         Set line color and width.
 
@@ -202,8 +585,7 @@ class PlotManager:
             color: Color ('r', 'g', 'b', or hex like '#FF0000')
             width: Line width in pixels
         """
-        if self.curve is not None:
-            self.curve.setPen(pg.mkPen(color=color, width=width))
+        self.curve.setPen(self._get_pen(color, width))
 
     # Export
 
@@ -211,26 +593,40 @@ class PlotManager:
         """
         Export plot to image file.
 
+        Raster formats are grabbed on the GUI thread and encoded in the
+        background, so this returns before the file is written;
+        ``export_finished(path, ok)`` is emitted when it is done.
+
         Args:
             filepath: Output file path (.png, .jpg, .svg)
         """
-        exporter = pg.exporters.ImageExporter(self.plot_item)
-        exporter.export(filepath)
+        filepath = str(filepath)
+
+        if filepath.lower().endswith('.svg'):
+            exporter = pg.exporters.SVGExporter(self.plot_item)
+            exporter.export(filepath)
+            self.export_finished.emit(filepath, True)
+            return
+
+        # QPixmap is GUI-thread only; hand the worker a QImage
+        image = self.widget.grab().toImage()
+        QThreadPool.globalInstance().start(
+            _ImageSaveTask(image, filepath, self._export_signals))
 
     # Utility
 
     def downsample_data(self, max_points: int = 1000):
         """
-        Downsample data for performance if needed.
+        Draw at most about ``max_points`` points.
+
+        Uses pyqtgraph's peak downsampling (min/max per bin) at display
+        time; the stored data is left untouched.
 
         Args:
-            max_points: Maximum number of points to keep
+            max_points: Maximum number of points to draw
         """
-        if len(self.x_data) > max_points:
-            step = len(self.x_data) // max_points
-            self.x_data = self.x_data[::step]
-            self.y_data = self.y_data[::step]
-            self.update()
+        ds = max(1, self._n // max_points)
+        self.plot_item.setDownsampling(ds=ds, auto=False, mode='peak')
 
     # Overlay management
 
@@ -249,7 +645,7 @@ class PlotManager:
             style: Line style ('solid', 'dash', 'dot')
 
         Returns:
-            PlotDataItem: The created overlay curve
+            PlotDataItem: The overlay curve (reused from the pool if possible)
         """
         # Auto-assign color if not provided
         if color is None:
@@ -263,23 +659,41 @@ class PlotManager:
             'dot': pg.QtCore.Qt.DotLine
         }.get(style, pg.QtCore.Qt.SolidLine)
 
-        pen = pg.mkPen(color=color, width=width, style=pen_style)
+        pen = self._get_pen(color, width, pen_style)
 
-        # Create overlay curve
-        overlay_curve = self.plot_item.plot(
-            x_data,
-            y_data,
-            pen=pen,
-            name=label  # For legend support
-        )
+        # Reuse a pooled curve; only create one when the pool is empty
+        if self._overlay_pool:
+            overlay_curve = self._overlay_pool.pop()
+        else:
+            overlay_curve = self.plot_item.plot(np.empty(0), np.empty(0))
+            # Overlays are static, so cache their rendering between repaints
+            overlay_curve.curve.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+
+        overlay_curve.setPen(pen)
+        overlay_curve.setData(x_data, y_data, name=label)  # name for legend support
+        overlay_curve.show()
+
+        legend = self.plot_item.legend
+        if legend is not None and label:
+            legend.addItem(overlay_curve, label)
 
         self.overlay_curves.append(overlay_curve)
         return overlay_curve
 
+    def _release_overlay(self, curve: pg.PlotDataItem):
+        """Hide an overlay curve and return it to the pool."""
+        legend = self.plot_item.legend
+        if legend is not None:
+            legend.removeItem(curve)
+
+        curve.hide()
+        curve.setData(np.empty(0), np.empty(0))
+        self._overlay_pool.append(curve)
+
     def clear_overlays(self):
         """Remove all overlay curves."""
         for curve in self.overlay_curves:
-            self.plot_item.removeItem(curve)
+            self._release_overlay(curve)
         self.overlay_curves.clear()
         self.overlay_color_index = 0
 
@@ -291,8 +705,7 @@ class PlotManager:
             index: Index of overlay to remove
         """
         if 0 <= index < len(self.overlay_curves):
-            self.plot_item.removeItem(self.overlay_curves[index])
-            del self.overlay_curves[index]
+            self._release_overlay(self.overlay_curves.pop(index))
 
     def get_overlay_count(self) -> int:
         """Get number of active overlays."""